@@ -40,7 +40,6 @@ from opendrop.app.common.image_processing.plugins.preview import (
 from opendrop.mvp import ComponentSymbol, View, Presenter
 from opendrop.geometry import Rect2
 from opendrop.widgets.canvas import ImageArtist, PolylineArtist
-from opendrop.features import colorize_labels
 from .model import IFTPreviewPluginModel
 
 ift_preview_plugin_cs = ComponentSymbol()  # type: ComponentSymbol[None]
@@ -54,10 +53,14 @@ class IFTPreviewPluginView(View['IFTPreviewPluginPresenter', None]):
 
         self._image_sequence_navigator_cid = None  # type: Optional[Any]
 
+        # Reused between frames, set_data() copies the mask into the artist's surface.
+        self._labels_mask = None  # type: Optional[np.ndarray]
+
         self._bg_artist = ImageArtist()
         self._canvas.add_artist(self._bg_artist, z_index=z_index)
 
-        self._features_artist = ImageArtist()
+        # Drop and needle edges are drawn in the same color, so draw the labels as an alpha mask.
+        self._features_artist = ImageArtist(mask_color=(0.5, 0.5, 1.0))
         self._canvas.add_artist(self._features_artist, z_index=z_index)
 
         self._needle_artist = PolylineArtist(
@@ -87,20 +90,18 @@ class IFTPreviewPluginView(View['IFTPreviewPluginPresenter', None]):
             self._features_artist.clear_data()
             return
 
-        data = colorize_labels(
-            labels,
-            colors=np.array([
-                0x00000000,
-                0xff8080ff,  # Drop edges
-                0xff8080ff,  # Needle edges
-            ], dtype=np.uint32).view(np.uint8).reshape(-1, 4),
-        )
+        if self._labels_mask is None or self._labels_mask.shape != labels.shape:
+            self._labels_mask = np.empty(labels.shape, dtype=np.uint8)
+
+        mask = self._labels_mask
+        np.not_equal(labels, 0, out=mask.view(bool))
+        mask *= 0xff
 
         width = labels.shape[1]
         height = labels.shape[0]
 
         self._features_artist.extents = Rect2(0, 0, width, height)
-        self._features_artist.set_data(data, cairo.Format.ARGB32, width, height)
+        self._features_artist.set_data(mask, cairo.Format.A8, width, height)
 
     def set_needle(self, needle_rect: Optional[Tuple]) -> None:
         if needle_rect is None:
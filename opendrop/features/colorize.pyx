@@ -1,5 +1,6 @@
 cimport cython
 from libc.stdint cimport *
+from libc.stdlib cimport malloc, free
 from libc.string cimport memcpy
 from cpython cimport array
 import array
@@ -23,8 +24,12 @@ ctypedef fused integral:
 @cython.wraparound(False)
 def colorize_labels(integral[:, :] labels not None, uint8_t[:, ::1] colors not None):
     cdef size_t i, j, n
+    cdef size_t height = labels.shape[0]
+    cdef size_t width = labels.shape[1]
+    cdef size_t num_colors = colors.shape[0]
     cdef array.array arr
-    cdef uint8_t[:, :, :] view
+    cdef uint32_t *lut
+    cdef uint32_t *out
     
     if colors.shape[1] != 4:
         raise ValueError(
@@ -33,20 +38,31 @@ def colorize_labels(integral[:, :] labels not None, uint8_t[:, ::1] colors not N
         )
     
     arr = array.array('B')
-    array.resize(arr, labels.shape[0]*labels.shape[1]*4)
+    array.resize(arr, height*width*4)
     
-    view = <uint8_t[:labels.shape[0], :labels.shape[1], :4]> arr.data.as_uchars
-
-    for i in range(labels.shape[0]):
-        for j in range(labels.shape[1]):
-            n = labels[i][j]
-            
-            if n >= colors.shape[0]:
-                raise IndexError(
-                    "index {} is out of bounds for axis 0 of colors array with shape {}"
-                    .format(n, (colors.shape[0], colors.shape[1]))
-                )
-            
-            memcpy(<void *>&view[i][j][0], <void *>&colors[n][0], 4)
+    out = <uint32_t *> arr.data.as_voidptr
+
+    # Copy colors into a table of 32-bit words so each pixel is written with a single store.
+    lut = <uint32_t *> malloc((num_colors + 1)*sizeof(uint32_t))
+    if lut == NULL:
+        raise MemoryError()
+
+    try:
+        for n in range(num_colors):
+            memcpy(<void *>&lut[n], <void *>&colors[n, 0], 4)
+
+        for i in range(height):
+            for j in range(width):
+                n = labels[i, j]
+                
+                if n >= num_colors:
+                    raise IndexError(
+                        "index {} is out of bounds for axis 0 of colors array with shape {}"
+                        .format(n, (colors.shape[0], colors.shape[1]))
+                    )
+                
+                out[i*width + j] = lut[n]
+    finally:
+        free(lut)
 
     return arr
@@ -52,6 +52,8 @@ class YoungLaplaceModel:
         self._params = np.empty(len(YoungLaplaceParam))
         self._params_set = False
         self._s = np.empty(shape=(self.data.shape[1],))
+        self._rz = np.empty(shape=(2, self.data.shape[1]))
+        self._rz_DBo = np.empty(shape=(2, self.data.shape[1]))
         self._residuals = np.empty(shape=(self.data.shape[1],))
         self._jac = np.empty(shape=(self.data.shape[1], len(self._params)))
 
@@ -81,8 +83,12 @@ class YoungLaplaceModel:
         data_r, data_z = Q.T @ (data_x - X0, data_y - Y0)
 
         s[:] = shape.closest(data_r/radius, data_z/radius)
-        r, z = radius * shape(s)
-        dr_dBo, dz_dBo = radius * shape.DBo(s)
+        rz = shape(s, out=self._rz)
+        rz *= radius
+        r, z = rz
+        rz_DBo = shape.DBo(s, out=self._rz_DBo)
+        rz_DBo *= radius
+        dr_dBo, dz_dBo = rz_DBo
         e_r = data_r - r
         e_z = data_z - z
         e = np.hypot(e_r, e_z)
@@ -90,11 +96,14 @@ class YoungLaplaceModel:
         # Set residues for points inside the drop as negative and outside as positive.
         e[np.signbit(e_r) != np.signbit(r)] *= -1
 
+        # Every derivative below is divided by e, so compute the reciprocal once.
+        e_inv = 1/e
+
         residuals[:] = e
-        de_dBo[:] = -(e_r*dr_dBo + e_z*dz_dBo) / e   # derivative w.r.t. Bond number
-        de_dR[:] = -(e_r*r + e_z*z) / (radius * e)   # derivative w.r.t. radius
-        de_dX0[:], de_dY0[:] = -Q @ (e_r, e_z) / e   # derivative w.r.t. apex (x, y)-coordinates
-        de_dw[:] = (e_r*z - e_z*r) / e               # derivative w.r.t. rotation
+        de_dBo[:] = -(e_r*dr_dBo + e_z*dz_dBo) * e_inv      # derivative w.r.t. Bond number
+        de_dR[:] = -(e_r*r + e_z*z) * e_inv * (1/radius)    # derivative w.r.t. radius
+        de_dX0[:], de_dY0[:] = -Q @ (e_r, e_z) * e_inv      # derivative w.r.t. apex (x, y)-coordinates
+        de_dw[:] = (e_r*z - e_z*r) * e_inv                  # derivative w.r.t. rotation
 
         self._params[:] = params
 
@@ -1,13 +1,19 @@
-from typing import Sequence
+from typing import Optional, Sequence, overload
 import numpy as np
 
 
 class YoungLaplaceShape:
     def __init__(self, bond: float) -> None: ...
 
+    @overload
     def __call__(self, s: float) -> np.ndarray: ...
+    @overload
+    def __call__(self, s: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray: ...
 
+    @overload
     def DBo(self, s: float) -> np.ndarray: ...
+    @overload
+    def DBo(self, s: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray: ...
 
     def z_inv(self, s: float) -> float: ...
 
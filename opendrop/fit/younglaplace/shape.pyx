@@ -28,20 +28,30 @@ ctypedef fused universal:
     long double[:]
 
 
+cdef check_out_shape(double[:, :] out, Py_ssize_t n):
+    if out.shape[0] != 2 or out.shape[1] != n:
+        raise ValueError(
+            "out must have shape {}, got {}"
+            .format((2, n), (out.shape[0], out.shape[1]))
+        )
+
+
 cdef class YoungLaplaceShape:
     cdef cYoungLaplaceShape shape
 
     def __cinit__(self, double bond):
         self.shape = cYoungLaplaceShape(bond)
 
-    def __call__(self, s):
-        return self.call(s)
+    def __call__(self, s, out=None):
+        return self.call(s, out)
 
-    def call(self, universal s):
+    def call(self, universal s, out=None):
         if universal in numeric:
+            if out is not None:
+                raise TypeError("out is only supported when s is an array")
             return self.call_single(s)
         elif universal in numeric[:]:
-            return self.call_array(s)
+            return self.call_array(s, out)
 
     cdef call_single(self, double s):
         cdef vector2f v = self.shape(s);
@@ -49,13 +59,15 @@ cdef class YoungLaplaceShape:
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    cdef call_array(self, numeric[:] s):
+    cdef call_array(self, numeric[:] s, out):
         cdef double[:, :] outview;
         cdef vector2f v;
         cdef size_t i;
 
-        out = np.empty((2, s.shape[0]))
+        if out is None:
+            out = np.empty((2, s.shape[0]))
         outview = out
+        check_out_shape(outview, s.shape[0])
 
         for i in range(s.shape[0]):
             v = self.shape(<double>s[i])
@@ -64,11 +76,13 @@ cdef class YoungLaplaceShape:
 
         return out
 
-    def DBo(self, universal s):
+    def DBo(self, universal s, out=None):
         if universal in numeric:
+            if out is not None:
+                raise TypeError("out is only supported when s is an array")
             return self.DBo_single(s)
         elif universal in numeric[:]:
-            return self.DBo_array(s)
+            return self.DBo_array(s, out)
 
     cdef DBo_single(self, double s):
         cdef vector2f v = self.shape.DBo(s)
@@ -76,13 +90,15 @@ cdef class YoungLaplaceShape:
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    cdef DBo_array(self, numeric[:] s):
+    cdef DBo_array(self, numeric[:] s, out):
         cdef double[:, :] outview;
         cdef vector2f v;
         cdef size_t i;
 
-        out = np.empty((2, s.shape[0]))
+        if out is None:
+            out = np.empty((2, s.shape[0]))
         outview = out
+        check_out_shape(outview, s.shape[0])
 
         for i in range(s.shape[0]):
             v = self.shape.DBo(<double>s[i])
@@ -27,7 +27,7 @@
 
 
 from collections import namedtuple
-from typing import Any, Optional, Iterable, Callable, Tuple, Mapping, MutableSequence, TypeVar, MutableMapping, Generic
+from typing import Any, Optional, Iterable, Callable, Tuple, Mapping, TypeVar, MutableMapping, Generic
 
 from opendrop.mvp.presenter import Presenter
 from opendrop.mvp.view import View
@@ -127,7 +127,7 @@ class Component(Generic[ComponentViewRepType]):
         self._view = view
         self._presenter = presenter
 
-        self._children = []  # type: MutableSequence[Component.ChildContainer]
+        self._children = {}  # type: MutableMapping[Component, Component.ChildContainer]
 
         self.on_destroyed = Event()
         self.is_destroyed = False
@@ -146,23 +146,20 @@ class Component(Generic[ComponentViewRepType]):
 
         new_child = cfactory.create(view_env=new_child_view_env, presenter_env=new_child_presenter_env)
 
-        self._children.append(self.ChildContainer(
+        self._children[new_child] = self.ChildContainer(
             component=new_child,
             on_destroyed_conn=new_child.on_destroyed.connect(self.remove_component)
-        ))
+        )
 
         return new_child
 
     def remove_component(self, component: 'Component') -> None:
-        for x in self._children:
-            if x.component == component:
-                child_container = x
-                break
-        else:
+        if component not in self._children:
             raise ValueError('Component is not a child of this')
 
-        self._children.remove(child_container)
+        self._release_child(self._children.pop(component))
 
+    def _release_child(self, child_container: 'Component.ChildContainer') -> None:
         child_container.on_destroyed_conn.disconnect()
         child_component = child_container.component
 
@@ -178,8 +175,9 @@ class Component(Generic[ComponentViewRepType]):
         return self.remove_component(component_id)
 
     def destroy(self) -> None:
-        for child_container in list(self._children):
-            self.remove_component(child_container.component)
+        children, self._children = self._children, {}
+        for child_container in children.values():
+            self._release_child(child_container)
 
         self._presenter._destroy()
         self._view._destroy()
@@ -26,13 +26,13 @@
 # with this software.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import functools
 import importlib
-import inspect
 import pkgutil
 import shutil
 from pathlib import Path
 from types import ModuleType
-from typing import Union, Type, List, Iterable, TypeVar
+from typing import Union, Type, List, Iterable, TypeVar, Tuple
 
 import numpy as np
 
@@ -51,17 +51,40 @@ def rotation_mat2d(theta: float) -> np.ndarray:
 
 
 def recursive_load(pkg: Union[ModuleType, str]) -> List[ModuleType]:
+    """Import `pkg` and all of its submodules, returning them in depth-first order.
+
+    Results are cached per package, so submodules added after the first call are not found until
+    `clear_recursive_load_cache()` is called.
+    """
     pkg = importlib.import_module(pkg) if isinstance(pkg, str) else pkg  # type: ModuleType
+    return list(_recursive_load(pkg))
+
+
+def clear_recursive_load_cache() -> None:
+    _recursive_load.cache_clear()
 
-    loaded_modules = [pkg]  # type: List[ModuleType]
 
-    if hasattr(pkg, '__path__'):
-        for loader, name, is_pkg in pkgutil.iter_modules(pkg.__path__):
-            full_name = pkg.__name__ + '.' + name
-            child = importlib.import_module(full_name)
-            loaded_modules += recursive_load(child)
+@functools.lru_cache(maxsize=None)
+def _recursive_load(pkg: ModuleType) -> Tuple[ModuleType, ...]:
+    loaded_modules = []  # type: List[ModuleType]
+    stack = [pkg]  # type: List[Union[ModuleType, str]]
 
-    return loaded_modules
+    while stack:
+        module = stack.pop()
+        if isinstance(module, str):
+            module = importlib.import_module(module)
+
+        loaded_modules.append(module)
+
+        if hasattr(module, '__path__'):
+            child_names = [
+                module.__name__ + '.' + name
+                for loader, name, is_pkg in pkgutil.iter_modules(module.__path__)
+            ]
+            # Push in reverse so submodules are imported and listed in depth-first order.
+            stack.extend(reversed(child_names))
+
+    return tuple(loaded_modules)
 
 
 def get_classes_in_modules(m: Union[Iterable[ModuleType], ModuleType], cls: T) -> List[T]:
@@ -73,10 +96,10 @@ def get_classes_in_modules(m: Union[Iterable[ModuleType], ModuleType], cls: T) -
 
         return clses
 
-    for name in dir(m):
-        attr = getattr(m, name)
-
-        if inspect.isclass(attr) and issubclass(attr, cls) and attr.__module__ == m.__name__:
+    # Iterate in attribute name order, like dir(). Check the cheap conditions first, most attributes are not
+    # classes defined in this module.
+    for _, attr in sorted(vars(m).items()):
+        if isinstance(attr, type) and attr.__module__ == m.__name__ and issubclass(attr, cls):
             clses.append(attr)
 
     return clses
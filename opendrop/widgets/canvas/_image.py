@@ -1,5 +1,5 @@
 import sys
-from typing import Optional
+from typing import Optional, Tuple
 
 import cairo
 import cv2
@@ -16,6 +16,7 @@ __all__ = ('ImageArtist',)
 
 class ImageArtist(Artist):
     _extents: Optional[Rect2[float]] = None
+    _mask_color: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 
     _window: Optional[Gdk.Window] = None
     _surface: Optional[cairo.ImageSurface] = None
@@ -45,8 +46,13 @@ class ImageArtist(Artist):
         pattern.set_filter(cairo.Filter.FAST)
         pattern.set_matrix(matrix)
 
-        cr.set_source(pattern)
-        cr.paint()
+        if surface.get_format() == cairo.Format.A8:
+            # Alpha-only surfaces are drawn as a mask over a solid color.
+            cr.set_source_rgb(*self._mask_color)
+            cr.mask(pattern)
+        else:
+            cr.set_source(pattern)
+            cr.paint()
 
         self._last_drawn_region = cairo.Region(cairo.RectangleInt(
             int(extents.x - 1),
@@ -82,6 +88,9 @@ class ImageArtist(Artist):
         self.set_data(data, cairo.Format.ARGB32, width, height)
 
     def set_data(self, data: memoryview, fmt: cairo.Format, width: int, height: int):
+        """Copy tightly packed pixel data of format fmt into the artist's surface. cairo.Format.A8 data is
+        drawn as a mask, filled with the color of the mask_color property.
+        """
         if self._surface is not None and \
                 self._surface_for_current_window \
                 and self._surface.get_format() == fmt \
@@ -101,8 +110,16 @@ class ImageArtist(Artist):
             surface = cairo.ImageSurface(fmt, width, height)
             self._surface_for_current_window = False
 
+        data = memoryview(data).cast('B')
+        stride = surface.get_stride()
+
         surface.flush()
-        surface.get_data()[:] = memoryview(data).cast('B')
+        if stride*height == data.nbytes:
+            surface.get_data()[:] = data
+        else:
+            # Surface rows are padded (e.g. A8 rows are aligned to 4 bytes), copy row by row.
+            surface_rows = np.ndarray((height, stride), np.uint8, surface.get_data())
+            surface_rows[:, :data.nbytes//height] = np.frombuffer(data, np.uint8).reshape(height, -1)
         surface.mark_dirty()
 
         self._surface = surface
@@ -136,3 +153,12 @@ class ImageArtist(Artist):
 
         if inv_region is not None:
             self.invalidate(inv_region)
+
+    @GObject.Property
+    def mask_color(self) -> Tuple[float, float, float]:
+        return self._mask_color
+
+    @mask_color.setter
+    def mask_color(self, value: Tuple[float, float, float]) -> None:
+        self._mask_color = value
+        self.invalidate(self._last_drawn_region)
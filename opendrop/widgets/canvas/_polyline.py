@@ -73,16 +73,17 @@ class PolylineArtist(Artist):
             return
 
         polyline = cv2.approxPolyDP(
-            np.asarray(polyline, dtype=np.float32),
+            np.ascontiguousarray(polyline, dtype=np.float32),
             epsilon=0.5,
             closed=False
         ).reshape(-1, 2)
 
-        points_it = iter(polyline)
+        # Convert to Python floats in one pass, unpacking numpy rows point by point is much slower.
+        points_it = iter(polyline.tolist())
         cr.move_to(*next(points_it))
 
-        for point in points_it:
-            cr.line_to(*point)
+        for x, y in points_it:
+            cr.line_to(x, y)
 
     @GObject.Property
     def polyline(self) -> Union[_PointSequence, Sequence[_PointSequence], None]:
@@ -301,6 +301,25 @@ def test_component_destroy_destroys_child_components():
         mock_child.destroy.assert_called_once_with()
 
 
+def test_component_destroy_destroys_children_in_order_and_detaches():
+    component = Component(view=Mock(), presenter=Mock())
+
+    mock_cfactories = [MockComponentFactory() for _ in range(3)]
+    children = [component.new_component(mock_cfactory) for mock_cfactory in mock_cfactories]
+
+    destroyed = []
+    for child in children:
+        child.on_destroyed.connect(destroyed.append, weak_ref=False)
+
+    component.destroy()
+
+    # Children are destroyed in the order they were created.
+    assert destroyed == children
+
+    for child in children:
+        assert child.on_destroyed.num_connections == 1
+
+
 def test_component_new_component_for_view():
     mock_component = Mock()
     mock_child = mock_component.new_component.return_value
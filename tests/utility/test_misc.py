@@ -27,11 +27,14 @@
 
 
 import math
+import pkgutil
 import sys
+import types
+from unittest import mock
 
 import pytest
 
-from opendrop.utility.misc import recursive_load, get_classes_in_modules, clamp
+from opendrop.utility.misc import recursive_load, clear_recursive_load_cache, get_classes_in_modules, clamp
 from tests.samples import dummy_pkg
 
 
@@ -45,6 +48,14 @@ def test_get_classes_in_modules():
     }
 
 
+def test_get_classes_in_modules_with_unregistered_module():
+    m = types.ModuleType('dyn_mod')
+    exec('class B: pass\nclass A: pass', vars(m))
+
+    # Classes are returned in attribute name order.
+    assert get_classes_in_modules(m, object) == [m.A, m.B]
+
+
 def test_recursive_load():
     modules = recursive_load(dummy_pkg)
 
@@ -61,6 +72,33 @@ def test_recursive_load():
     }
 
 
+def test_recursive_load_repeated_calls():
+    modules = recursive_load(dummy_pkg)
+    modules.clear()
+
+    # Mutating a returned list should not affect later calls.
+    assert recursive_load('tests.samples.dummy_pkg') == recursive_load(dummy_pkg)
+    assert len(recursive_load(dummy_pkg)) == 4
+
+
+def test_clear_recursive_load_cache():
+    clear_recursive_load_cache()
+
+    with mock.patch('pkgutil.iter_modules', wraps=pkgutil.iter_modules) as iter_modules:
+        recursive_load(dummy_pkg)
+        num_walk_calls = iter_modules.call_count
+        assert num_walk_calls > 0
+
+        # Cached, package is not walked again.
+        recursive_load(dummy_pkg)
+        assert iter_modules.call_count == num_walk_calls
+
+        clear_recursive_load_cache()
+
+        recursive_load(dummy_pkg)
+        assert iter_modules.call_count == 2*num_walk_calls
+
+
 @pytest.mark.parametrize(
     '        x,     lower,    upper, expected', [
     (       -5,       -10,       -1,       -5),
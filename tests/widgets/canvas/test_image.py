@@ -0,0 +1,71 @@
+# Copyright © 2020, Joseph Berry, Rico Tabor (opendrop.dev@gmail.com)
+# OpenDrop is released under the GNU GPL License. You are free to
+# modify and distribute the code, but always under the same license
+#
+# If you use this software in your research, please cite the following
+# journal articles:
+#
+# J. D. Berry, M. J. Neeson, R. R. Dagastine, D. Y. C. Chan and
+# R. F. Tabor, Measurement of surface and interfacial tension using
+# pendant drop tensiometry. Journal of Colloid and Interface Science 454
+# (2015) 226–237. https://doi.org/10.1016/j.jcis.2015.05.012
+#
+# E. Huang, T. Denning, A. Skoufis, J. Qi, R. R. Dagastine, R. F. Tabor
+# and J. D. Berry, OpenDrop: Open-source software for pendant drop
+# tensiometry & contact angle measurements, submitted to the Journal of
+# Open Source Software
+#
+# These citations help us not only to understand who is using and
+# developing OpenDrop, and for what purpose, but also to justify
+# continued development of this code and other open source resources.
+#
+# OpenDrop is distributed WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.  You
+# should have received a copy of the GNU General Public License along
+# with this software.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+import cairo
+import numpy as np
+
+from opendrop.geometry import Rect2
+from opendrop.widgets.canvas import ImageArtist
+
+
+def test_image_artist_set_data_with_padded_stride():
+    # A8 surface rows are aligned to 4 bytes, so a width of 5 has a padded stride.
+    width, height = 5, 3
+    data = np.arange(width*height, dtype=np.uint8).reshape(height, width)
+
+    artist = ImageArtist()
+    artist.set_data(data, cairo.Format.A8, width, height)
+
+    surface = artist._surface
+    stride = surface.get_stride()
+    assert stride > width
+
+    rows = np.ndarray((height, stride), np.uint8, surface.get_data())
+    assert (rows[:, :width] == data).all()
+
+
+def test_image_artist_draws_a8_data_as_mask():
+    width, height = 5, 3
+    mask = np.zeros((height, width), dtype=np.uint8)
+    mask[1, 2] = 0xff
+
+    artist = ImageArtist(mask_color=(0.0, 0.0, 1.0))
+    artist.extents = Rect2(0, 0, width, height)
+    artist.set_data(mask, cairo.Format.A8, width, height)
+
+    target = cairo.ImageSurface(cairo.Format.ARGB32, width, height)
+    cr = cairo.Context(target)
+    artist.draw(cr)
+    target.flush()
+
+    pixels = np.ndarray((height, target.get_stride()//4), np.uint32, target.get_data())[:, :width]
+
+    expected = np.zeros((height, width), dtype=np.uint32)
+    expected[1, 2] = 0xff0000ff  # Opaque blue
+    assert (pixels == expected).all()